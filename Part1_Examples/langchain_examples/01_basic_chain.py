@@ -8,6 +8,7 @@ Key Concepts:
 - ChatPromptTemplate: Defines the prompt structure
 - ChatGroq: The LLM model (using Groq API)
 - Chain composition using | operator
+- SemanticCache: LLM cache that reuses answers for paraphrased prompts
 """
 
 from dotenv import load_dotenv
@@ -16,32 +17,47 @@ load_dotenv()  # Load environment variables from .env file
 from langchain_groq import ChatGroq
 from langchain_core.prompts import ChatPromptTemplate
 
+from semantic_cache import SemanticCache
+
+
+# Prompt template - parsed once at import
+PRODUCT_PROMPT = ChatPromptTemplate.from_template(
+    "Describe the key features of {product} in 3 concise bullet points."
+)
+
 
 def main():
     # Initialize the LLM with Groq
     # Note: Requires GROQ_API_KEY environment variable
+    # max_tokens caps generation - 3 concise bullets need far less than the default
+    # cache= answers semantically similar prompts without calling the API
+    cache = SemanticCache()
     llm = ChatGroq(
         model="llama-3.3-70b-versatile",
-        temperature=0.7
-    )
-    
-    # Create a prompt template
-    prompt = ChatPromptTemplate.from_template(
-        "Describe the key features of {product} in 3 concise bullet points."
+        temperature=0.7,
+        max_tokens=150,
+        cache=cache
     )
     
     # Compose the chain using the pipe operator (LCEL)
-    chain = prompt | llm
-    
-    # Invoke the chain
-    result = chain.invoke({"product": "iPhone"})
+    chain = PRODUCT_PROMPT | llm
     
     # Display the result
     print("=" * 60)
     print("BASIC CHAIN EXAMPLE")
     print("=" * 60)
     print(f"\nProduct: iPhone")
-    print(f"\nResponse:\n{result.content}")
+    print(f"\nResponse:")
+    
+    # Invoke rather than stream: streamed calls bypass the LLM cache
+    response = chain.invoke({"product": "iPhone"})
+    print(response.content)
+    
+    # Invoke again with the same product - served from the cache, so no
+    # second API call. With sentence-transformers installed, a paraphrase
+    # such as "the iPhone" would hit too.
+    chain.invoke({"product": "iPhone"})
+    print(f"\nCache hits: {cache.hits}, misses: {cache.misses}")
     print("=" * 60)
 
 
@@ -6,7 +6,7 @@ to chain multiple operations together.
 
 Key Concepts:
 - RunnablePassthrough: Passes data through while adding new fields
-- assign(): Adds new fields to the state
+- assign(): Adds new fields to the state (independent fields run in parallel)
 - Multi-step composition
 """
 
@@ -18,6 +18,18 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnablePassthrough
 
 
+# Prompt that uses the extracted entities and sentiment - parsed once at import
+SUMMARY_PROMPT = ChatPromptTemplate.from_template(
+    """Given the following analysis:
+        
+Text: {text}
+Entities: {entities}
+Sentiment: {sentiment}
+
+Generate a brief summary highlighting the key points."""
+)
+
+
 def extract_entities(data: dict) -> str:
     """Simulates entity extraction from text."""
     text = data.get("text", "")
@@ -40,22 +52,15 @@ def main():
         temperature=0.7
     )
     
-    # Create a prompt that uses the extracted entities and sentiment
-    prompt = ChatPromptTemplate.from_template(
-        """Given the following analysis:
-        
-Text: {text}
-Entities: {entities}
-Sentiment: {sentiment}
-
-Generate a brief summary highlighting the key points."""
-    )
-    
     # Build the multi-step pipeline
+    # Entities and sentiment are independent, so a single assign() computes
+    # them as RunnableParallel branches and merges both into one dict
     pipeline = (
-        RunnablePassthrough.assign(entities=extract_entities)
-        | RunnablePassthrough.assign(sentiment=analyze_sentiment)
-        | prompt
+        RunnablePassthrough.assign(
+            entities=extract_entities,
+            sentiment=analyze_sentiment
+        )
+        | SUMMARY_PROMPT
         | llm
     )
     
@@ -64,15 +69,17 @@ Generate a brief summary highlighting the key points."""
         "text": "The new iPhone is amazing! Apple has outdone themselves with this technology."
     }
     
-    # Run the pipeline
-    result = pipeline.invoke(input_data)
-    
     # Display results
     print("=" * 60)
     print("MULTI-STEP PIPELINE EXAMPLE")
     print("=" * 60)
     print(f"\nInput Text: {input_data['text']}")
-    print(f"\nFinal Summary:\n{result.content}")
+    print(f"\nFinal Summary:")
+    
+    # Run the pipeline, streaming the summary as it is generated
+    for chunk in pipeline.stream(input_data):
+        print(chunk.content, end="", flush=True)
+    print()
     print("=" * 60)
 
 
@@ -13,11 +13,27 @@ Key Concepts:
 from dotenv import load_dotenv
 load_dotenv()
 
+import re
+
 from langchain_groq import ChatGroq
 from langchain_core.tools import tool
 from langchain_core.prompts import ChatPromptTemplate
 
 
+# Simulated product database, indexed by product name
+PRODUCT_INDEX = {
+    "keyboard": "$99",
+    "mouse": "$49",
+    "monitor": "$299",
+    "laptop": "$1299"
+}
+
+WORD_RE = re.compile(r"\w+")
+
+# Numeric part of a price string, e.g. "$1,299.50" -> "1,299.50"
+NUMBER_RE = re.compile(r"[-+]?\d[\d,]*(?:\.\d+)?")
+
+
 @tool
 def search_product(name: str) -> str:
     """Search for a product and return its price.
@@ -28,18 +44,11 @@ def search_product(name: str) -> str:
     Returns:
         Product information including price
     """
-    # Simulated product database
-    products = {
-        "keyboard": "$99",
-        "mouse": "$49",
-        "monitor": "$299",
-        "laptop": "$1299"
-    }
-    
-    name_lower = name.lower()
-    for product, price in products.items():
-        if product in name_lower:
-            return f"{product.capitalize()}: {price}"
+    # Hash lookup per word instead of scanning every product
+    for token in WORD_RE.findall(name.lower()):
+        price = PRODUCT_INDEX.get(token)
+        if price is not None:
+            return f"{token.capitalize()}: {price}"
     
     return f"Product '{name}' not found in our database."
 
@@ -55,48 +64,63 @@ def calculate_discount(price: str, discount_percent: int) -> str:
     Returns:
         Discounted price
     """
-    try:
-        # Extract numeric value from price string
-        numeric_price = float(price.replace("$", ""))
-        discounted = numeric_price * (1 - discount_percent / 100)
-        return f"${discounted:.2f}"
-    except:
+    # Extract numeric value from price string
+    match = NUMBER_RE.search(price)
+    if match is None:
         return "Error calculating discount"
+    
+    numeric_price = float(match.group().replace(",", ""))
+    discounted = numeric_price * (1 - discount_percent / 100)
+    return f"${discounted:.2f}"
 
 
-def simple_agent(query: str, tools: list, llm):
-    """
-    A simple agent that uses LLM to decide which tools to use.
-    This is a simplified version that works without advanced tool-calling APIs.
-    """
-    
-    # Create tool descriptions
-    tool_descriptions = "\n".join([
-        f"- {tool.name}: {tool.description}" 
-        for tool in tools
-    ])
-    
-    # First, ask LLM to analyze the query and decide which tools to use
-    analysis_prompt = ChatPromptTemplate.from_template(
-        """You are a helpful assistant with access to these tools:
+# Tool registry and descriptions - built once at import, not per query
+TOOLS_BY_NAME = {t.name: t for t in [search_product, calculate_discount]}
+TOOL_DESCRIPTIONS = "\n".join(
+    f"- {t.name}: {t.description}" for t in TOOLS_BY_NAME.values()
+)
+
+# Patterns used to pull arguments out of the query and tool results
+DISCOUNT_RE = re.compile(r'(\d+)%')
+PRICE_RE = re.compile(r'\$(\d+)')
 
-{tool_descriptions}
 
-User query: {query}
+# Prompt templates - parsed once at import, not on every simple_agent call.
+# Static instructions and tool descriptions come first in the system message
+# and per-query content comes last, so every call shares the same prompt
+# prefix and the provider can serve it from its prompt cache.
+ANALYSIS_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are a helpful assistant with access to these tools:
+
+{tool_descriptions}
 
-Think step by step:
+For each user query, think step by step:
 1. What information do I need?
 2. Which tool(s) should I use?
 3. In what order?
 
-Provide your analysis and the tool(s) to use."""
-    )
+Provide your analysis and the tool(s) to use."""),
+    ("human", "User query: {query}")
+]).partial(tool_descriptions=TOOL_DESCRIPTIONS)
+
+FINAL_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", "Answer the user's question based on the tool results provided. Provide a clear, concise answer."),
+    ("human", """User query: {query}
+
+Tool results:
+{tool_results}""")
+])
+
+
+def simple_agent(query: str, llm):
+    """
+    A simple agent that uses LLM to decide which tools to use.
+    This is a simplified version that works without advanced tool-calling APIs.
+    """
     
-    analysis_chain = analysis_prompt | llm
-    analysis = analysis_chain.invoke({
-        "tool_descriptions": tool_descriptions,
-        "query": query
-    })
+    # First, ask LLM to analyze the query and decide which tools to use
+    analysis_chain = ANALYSIS_PROMPT | llm
+    analysis = analysis_chain.invoke({"query": query})
     
     print(f"\n[Agent Thinking]: {analysis.content[:200]}...")
     
@@ -106,54 +130,47 @@ Provide your analysis and the tool(s) to use."""
     
     # Check if we need to search for a product
     if any(word in query.lower() for word in ["cost", "price", "keyboard", "mouse", "monitor", "laptop"]):
-        for tool in tools:
-            if tool.name == "search_product":
-                # Extract product name from query
-                for product in ["keyboard", "mouse", "monitor", "laptop"]:
-                    if product in query.lower():
-                        result = tool.invoke({"name": product})
-                        results.append(f"Product search result: {result}")
-                        print(f"[Tool Used]: search_product('{product}') -> {result}")
+        tool = TOOLS_BY_NAME["search_product"]
+        # Extract product name from query
+        for product in ["keyboard", "mouse", "monitor", "laptop"]:
+            if product in query.lower():
+                result = tool.invoke({"name": product})
+                results.append(f"Product search result: {result}")
+                print(f"[Tool Used]: search_product('{product}') -> {result}")
     
     # Check if we need to calculate discount
     if "discount" in query.lower():
         # Try to extract discount percentage
-        import re
-        discount_match = re.search(r'(\d+)%', query)
+        discount_match = DISCOUNT_RE.search(query)
         if discount_match and results:
             discount_percent = int(discount_match.group(1))
             # Get price from previous result
-            price_match = re.search(r'\$(\d+)', results[0])
+            price_match = PRICE_RE.search(results[0])
             if price_match:
                 price = f"${price_match.group(1)}"
-                for tool in tools:
-                    if tool.name == "calculate_discount":
-                        result = tool.invoke({
-                            "price": price,
-                            "discount_percent": discount_percent
-                        })
-                        results.append(f"Discount calculation: {result}")
-                        print(f"[Tool Used]: calculate_discount('{price}', {discount_percent}) -> {result}")
+                tool = TOOLS_BY_NAME["calculate_discount"]
+                result = tool.invoke({
+                    "price": price,
+                    "discount_percent": discount_percent
+                })
+                results.append(f"Discount calculation: {result}")
+                print(f"[Tool Used]: calculate_discount('{price}', {discount_percent}) -> {result}")
     
     # Generate final answer using the tool results
-    final_prompt = ChatPromptTemplate.from_template(
-        """Based on the following information, answer the user's question:
-
-User query: {query}
-
-Tool results:
-{tool_results}
-
-Provide a clear, concise answer."""
-    )
+    final_chain = FINAL_PROMPT | llm
     
-    final_chain = final_prompt | llm
-    final_answer = final_chain.invoke({
+    # Stream the final answer so it prints as it is generated
+    print("\n[Final Answer]: ", end="", flush=True)
+    final_answer = []
+    for chunk in final_chain.stream({
         "query": query,
         "tool_results": "\n".join(results) if results else "No tools were needed."
-    })
+    }):
+        print(chunk.content, end="", flush=True)
+        final_answer.append(chunk.content)
+    print()
     
-    return final_answer.content
+    return "".join(final_answer)
 
 
 def main():
@@ -163,9 +180,6 @@ def main():
         temperature=0.7
     )
     
-    # Define tools
-    tools = [search_product, calculate_discount]
-    
     # Test the agent
     print("=" * 60)
     print("SIMPLE TOOL-USING AGENT EXAMPLE")
@@ -175,15 +189,13 @@ def main():
     print("\n--- Example 1: Product Search ---")
     query1 = "What does a keyboard cost?"
     print(f"Query: {query1}")
-    result1 = simple_agent(query1, tools, llm)
-    print(f"\n[Final Answer]: {result1}")
+    simple_agent(query1, llm)
     
     # Example 2: Multi-step reasoning with tools
     print("\n\n--- Example 2: Price with Discount ---")
     query2 = "What would a monitor cost with a 15% discount?"
     print(f"Query: {query2}")
-    result2 = simple_agent(query2, tools, llm)
-    print(f"\n[Final Answer]: {result2}")
+    simple_agent(query2, llm)
     
     print("\n" + "=" * 60)
    
@@ -16,61 +16,68 @@ Key Concepts:
 from dotenv import load_dotenv
 load_dotenv()
 
+import asyncio
+
 from langchain_groq import ChatGroq
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnablePassthrough, RunnableLambda, RunnableParallel
 from langchain_core.output_parsers import StrOutputParser
 
 
-def main():
-    # Initialize the LLM
+# Prompt templates - parsed once at import
+
+# Component 1: Topic analyzer
+TOPIC_PROMPT = ChatPromptTemplate.from_template(
+    "Identify the main topic in one word: {text}"
+)
+
+# Component 2: Sentiment analyzer
+SENTIMENT_PROMPT = ChatPromptTemplate.from_template(
+    "What is the sentiment (positive/negative/neutral): {text}"
+)
+
+# Component 3: Summary generator
+SUMMARY_PROMPT = ChatPromptTemplate.from_template(
+    "Summarize in one sentence: {text}"
+)
+
+# Final composition: Analyze, then generate report
+REPORT_PROMPT = ChatPromptTemplate.from_template(
+    """Based on this analysis:
+        
+Topic: {topic}
+Sentiment: {sentiment}
+Summary: {summary}
+
+Generate a brief analytical report."""
+)
+
+
+async def main():
+    # Initialize the LLM (one instance shared by every chain below)
     llm = ChatGroq(
         model="llama-3.3-70b-versatile",
         temperature=0.7
     )
     
-    # Component 1: Topic analyzer
-    topic_prompt = ChatPromptTemplate.from_template(
-        "Identify the main topic in one word: {text}"
-    )
-    topic_chain = topic_prompt | llm | StrOutputParser()
-    
-    # Component 2: Sentiment analyzer
-    sentiment_prompt = ChatPromptTemplate.from_template(
-        "What is the sentiment (positive/negative/neutral): {text}"
-    )
-    sentiment_chain = sentiment_prompt | llm | StrOutputParser()
-    
-    # Component 3: Summary generator
-    summary_prompt = ChatPromptTemplate.from_template(
-        "Summarize in one sentence: {text}"
-    )
-    summary_chain = summary_prompt | llm | StrOutputParser()
+    # Components: each prompt | llm | parser is a reusable chain
+    topic_chain = TOPIC_PROMPT | llm | StrOutputParser()
+    sentiment_chain = SENTIMENT_PROMPT | llm | StrOutputParser()
+    summary_chain = SUMMARY_PROMPT | llm | StrOutputParser()
     
     # Compose everything together using RunnableParallel
-    # This runs all three chains in parallel
+    # Under ainvoke the three branches run as concurrent asyncio tasks
     parallel_analysis = RunnableParallel(
         topic=topic_chain,
         sentiment=sentiment_chain,
         summary=summary_chain
     )
     
-    # Final composition: Analyze, then generate report
-    report_prompt = ChatPromptTemplate.from_template(
-        """Based on this analysis:
-        
-Topic: {topic}
-Sentiment: {sentiment}
-Summary: {summary}
-
-Generate a brief analytical report."""
-    )
-    
     # Complete pipeline
     full_pipeline = (
         {"text": RunnablePassthrough()}  # Pass input text to all parallel chains
         | parallel_analysis
-        | report_prompt
+        | REPORT_PROMPT
         | llm
         | StrOutputParser()
     )
@@ -86,11 +93,11 @@ Generate a brief analytical report."""
     print("\nProcessing through composed pipeline...")
     print("-" * 70)
     
-    result = full_pipeline.invoke(test_text)
+    result = await full_pipeline.ainvoke(test_text)
     
     print(f"\nFinal Report:\n{result}")
     print("\n" + "=" * 70)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -14,6 +14,11 @@ Key Concepts:
 from dotenv import load_dotenv
 load_dotenv()
 
+import asyncio
+import io
+from collections import OrderedDict
+from functools import partial
+
 from langchain_groq import ChatGroq
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import HumanMessage, AIMessage
@@ -21,8 +26,34 @@ from langchain_core.runnables.history import RunnableWithMessageHistory
 from langchain_core.chat_history import BaseChatMessageHistory, InMemoryChatMessageHistory
 
 
-# Store for conversation histories
-store = {}
+# Maximum number of sessions kept in memory (least recently used evicted)
+MAX_SESSIONS = 128
+
+# Number of recent turns (user + assistant pairs) sent to the LLM
+HISTORY_WINDOW = 6
+
+# One LLM client shared by all three examples, so their concurrent requests
+# reuse a single HTTP connection pool instead of opening one pool each
+llm = ChatGroq(
+    model="llama-3.3-70b-versatile",
+    temperature=0.7
+)
+
+# Store for conversation histories, ordered by recent use
+store = OrderedDict()
+
+# Prompt templates that include the recent message history - parsed once
+MEMORY_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", "You are a helpful assistant. Keep track of the conversation context."),
+    MessagesPlaceholder(variable_name="history", n_messages=2 * HISTORY_WINDOW),
+    ("human", "{input}")
+])
+
+SESSION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", "You are a helpful assistant."),
+    MessagesPlaceholder(variable_name="history", n_messages=2 * HISTORY_WINDOW),
+    ("human", "{input}")
+])
 
 
 def get_session_history(session_id: str) -> BaseChatMessageHistory:
@@ -35,33 +66,29 @@ def get_session_history(session_id: str) -> BaseChatMessageHistory:
     Returns:
         Chat message history for the session
     """
-    if session_id not in store:
-        store[session_id] = InMemoryChatMessageHistory()
-    return store[session_id]
+    history = store.get(session_id)
+    if history is None:
+        history = store[session_id] = InMemoryChatMessageHistory()
+        if len(store) > MAX_SESSIONS:
+            store.popitem(last=False)
+    else:
+        store.move_to_end(session_id)
+    return history
 
 
-def example_1_basic_memory():
+async def example_1_basic_memory():
     """Example 1: Basic conversation with memory using modern approach."""
     
-    print("\n" + "=" * 70)
-    print("EXAMPLE 1: Basic Conversation Memory")
-    print("=" * 70)
+    # Buffer output so concurrently running examples don't interleave
+    out = io.StringIO()
+    echo = partial(print, file=out)
     
-    # Initialize LLM
-    llm = ChatGroq(
-        model="llama-3.3-70b-versatile",
-        temperature=0.7
-    )
-    
-    # Create a prompt that includes message history
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", "You are a helpful assistant. Keep track of the conversation context."),
-        MessagesPlaceholder(variable_name="history"),
-        ("human", "{input}")
-    ])
+    echo("\n" + "=" * 70)
+    echo("EXAMPLE 1: Basic Conversation Memory")
+    echo("=" * 70)
     
     # Create the chain
-    chain = prompt | llm
+    chain = MEMORY_PROMPT | llm
     
     # Wrap with message history
     chain_with_history = RunnableWithMessageHistory(
@@ -75,81 +102,84 @@ def example_1_basic_memory():
     session_id = "user_123"
     
     # Turn 1
-    print("\n[Turn 1]")
-    print("User: My name is Alice")
-    response1 = chain_with_history.invoke(
+    echo("\n[Turn 1]")
+    echo("User: My name is Alice")
+    response1 = await chain_with_history.ainvoke(
         {"input": "My name is Alice"},
         config={"configurable": {"session_id": session_id}}
     )
-    print(f"Assistant: {response1.content}")
+    echo(f"Assistant: {response1.content}")
     
     # Turn 2 - Test if it remembers
-    print("\n[Turn 2]")
-    print("User: What's my name?")
-    response2 = chain_with_history.invoke(
+    echo("\n[Turn 2]")
+    echo("User: What's my name?")
+    response2 = await chain_with_history.ainvoke(
         {"input": "What's my name?"},
         config={"configurable": {"session_id": session_id}}
     )
-    print(f"Assistant: {response2.content}")
+    echo(f"Assistant: {response2.content}")
     
     # Turn 3 - Continue conversation
-    print("\n[Turn 3]")
-    print("User: What did I tell you in the first message?")
-    response3 = chain_with_history.invoke(
+    echo("\n[Turn 3]")
+    echo("User: What did I tell you in the first message?")
+    response3 = await chain_with_history.ainvoke(
         {"input": "What did I tell you in the first message?"},
         config={"configurable": {"session_id": session_id}}
     )
-    print(f"Assistant: {response3.content}")
+    echo(f"Assistant: {response3.content}")
     
-    print("\n" + "=" * 70)
+    echo("\n" + "=" * 70)
+    return out.getvalue()
 
 
-def example_2_manual_memory():
+async def example_2_manual_memory():
     """Example 2: Manual memory management with explicit message list."""
     
+    # Printed directly (not buffered) so the streamed replies appear live
     print("\n" + "=" * 70)
     print("EXAMPLE 2: Manual Memory Management")
     print("=" * 70)
     
-    # Initialize LLM
-    llm = ChatGroq(
-        model="llama-3.3-70b-versatile",
-        temperature=0.7
-    )
-    
     # Manually maintain conversation history
     conversation_history = [
         {"role": "system", "content": "You are a helpful math tutor."}
     ]
     
-    def chat(user_message: str) -> str:
-        """Send a message and get a response while maintaining history."""
+    async def chat(user_message: str) -> str:
+        """Send a message and stream the response while maintaining history."""
         # Add user message to history
         conversation_history.append({"role": "user", "content": user_message})
         
-        # Get response from LLM
-        response = llm.invoke(conversation_history)
+        # Send the system message plus a sliding window of recent turns,
+        # so input tokens stay bounded as the conversation grows
+        trimmed = [conversation_history[0]] + conversation_history[1:][-2 * HISTORY_WINDOW:]
+        
+        # Stream response from LLM, printing tokens as they arrive
+        print("Assistant: ", end="", flush=True)
+        chunks = []
+        async for chunk in llm.astream(trimmed):
+            print(chunk.content, end="", flush=True)
+            chunks.append(chunk.content)
+        print()
+        response = "".join(chunks)
         
         # Add assistant response to history
-        conversation_history.append({"role": "assistant", "content": response.content})
+        conversation_history.append({"role": "assistant", "content": response})
         
-        return response.content
+        return response
     
     # Conversation
     print("\n[Turn 1]")
     print("User: What is 5 + 3?")
-    response1 = chat("What is 5 + 3?")
-    print(f"Assistant: {response1}")
+    await chat("What is 5 + 3?")
     
     print("\n[Turn 2]")
     print("User: Now multiply that by 2")
-    response2 = chat("Now multiply that by 2")
-    print(f"Assistant: {response2}")
+    await chat("Now multiply that by 2")
     
     print("\n[Turn 3]")
     print("User: What was my first question?")
-    response3 = chat("What was my first question?")
-    print(f"Assistant: {response3}")
+    await chat("What was my first question?")
     
     # Show conversation history
     print("\n[Conversation History]")
@@ -160,26 +190,18 @@ def example_2_manual_memory():
     print("\n" + "=" * 70)
 
 
-def example_3_session_management():
+async def example_3_session_management():
     """Example 3: Multiple conversation sessions."""
     
-    print("\n" + "=" * 70)
-    print("EXAMPLE 3: Multiple Conversation Sessions")
-    print("=" * 70)
+    # Buffer output so concurrently running examples don't interleave
+    out = io.StringIO()
+    echo = partial(print, file=out)
     
-    # Initialize LLM
-    llm = ChatGroq(
-        model="llama-3.3-70b-versatile",
-        temperature=0.7
-    )
+    echo("\n" + "=" * 70)
+    echo("EXAMPLE 3: Multiple Conversation Sessions")
+    echo("=" * 70)
     
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", "You are a helpful assistant."),
-        MessagesPlaceholder(variable_name="history"),
-        ("human", "{input}")
-    ])
-    
-    chain = prompt | llm
+    chain = SESSION_PROMPT | llm
     
     chain_with_history = RunnableWithMessageHistory(
         chain,
@@ -189,45 +211,46 @@ def example_3_session_management():
     )
     
     # Session 1: Alice
-    print("\n[Session 1: Alice]")
-    response_alice = chain_with_history.invoke(
+    echo("\n[Session 1: Alice]")
+    response_alice = await chain_with_history.ainvoke(
         {"input": "My favorite color is blue"},
         config={"configurable": {"session_id": "alice_session"}}
     )
-    print(f"Alice: My favorite color is blue")
-    print(f"Assistant: {response_alice.content}")
+    echo(f"Alice: My favorite color is blue")
+    echo(f"Assistant: {response_alice.content}")
     
     # Session 2: Bob
-    print("\n[Session 2: Bob]")
-    response_bob = chain_with_history.invoke(
+    echo("\n[Session 2: Bob]")
+    response_bob = await chain_with_history.ainvoke(
         {"input": "My favorite color is red"},
         config={"configurable": {"session_id": "bob_session"}}
     )
-    print(f"Bob: My favorite color is red")
-    print(f"Assistant: {response_bob.content}")
+    echo(f"Bob: My favorite color is red")
+    echo(f"Assistant: {response_bob.content}")
     
     # Back to Session 1: Alice
-    print("\n[Back to Session 1: Alice]")
-    response_alice2 = chain_with_history.invoke(
+    echo("\n[Back to Session 1: Alice]")
+    response_alice2 = await chain_with_history.ainvoke(
         {"input": "What's my favorite color?"},
         config={"configurable": {"session_id": "alice_session"}}
     )
-    print(f"Alice: What's my favorite color?")
-    print(f"Assistant: {response_alice2.content}")
+    echo(f"Alice: What's my favorite color?")
+    echo(f"Assistant: {response_alice2.content}")
     
     # Back to Session 2: Bob
-    print("\n[Back to Session 2: Bob]")
-    response_bob2 = chain_with_history.invoke(
+    echo("\n[Back to Session 2: Bob]")
+    response_bob2 = await chain_with_history.ainvoke(
         {"input": "What's my favorite color?"},
         config={"configurable": {"session_id": "bob_session"}}
     )
-    print(f"Bob: What's my favorite color?")
-    print(f"Assistant: {response_bob2.content}")
+    echo(f"Bob: What's my favorite color?")
+    echo(f"Assistant: {response_bob2.content}")
     
-    print("\n" + "=" * 70)
+    echo("\n" + "=" * 70)
+    return out.getvalue()
 
 
-def main():
+async def main():
     print("=" * 70)
     print("LANGCHAIN MEMORY EXAMPLES")
     print("=" * 70)
@@ -236,14 +259,23 @@ def main():
     print("2. Manual memory management")
     print("3. Multiple conversation sessions")
     
-    # Run examples
-    example_1_basic_memory()
-    example_2_manual_memory()
-    example_3_session_management()
+    # Run examples concurrently - sessions are independent, so their
+    # LLM round-trips overlap. Turns within each example stay sequential.
+    # Examples 1 and 3 buffer their output; example 2 streams its replies
+    # straight to the terminal, so it starts once example 1 has printed.
+    example_1 = asyncio.create_task(example_1_basic_memory())
+    example_3 = asyncio.create_task(example_3_session_management())
+    try:
+        print(await example_1, end="")
+        await example_2_manual_memory()
+    finally:
+        # Always await example 3, so its errors are reported too
+        output_3 = await example_3
+    print(output_3, end="")
     
     print("\n" + "=" * 70)
    
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -0,0 +1,148 @@
+"""
+Semantic Response Cache
+=======================
+A LangChain LLM cache that skips the model call when a prompt is textually or
+semantically close to one that has already been answered.
+
+Key Concepts:
+- BaseCache: Plugged in with ChatGroq(cache=...), so runs and callbacks still fire
+- Sentence embeddings: prompts are embedded with MiniLM (all-MiniLM-L6-v2)
+- Cosine similarity: a stored answer is reused when similarity >= threshold
+- LRU eviction: the cache holds at most `maxsize` entries
+
+Only the final message of a prompt is compared semantically. Everything before
+it (system prompt, conversation history) and the model settings must match
+exactly. The whole final message is embedded, template text included, so keep
+the threshold high when prompts share a long template.
+
+If sentence-transformers is not installed, or the embedding model can't be
+loaded, the cache falls back to exact matching on the normalized message text.
+"""
+
+import json
+from collections import OrderedDict
+from typing import Optional
+
+from langchain_core.caches import BaseCache, RETURN_VAL_TYPE
+
+
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+def _load_encoder(model_name: str):
+    """Load the sentence-transformers encoder, or None if it is unavailable."""
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        return None
+    try:
+        return SentenceTransformer(model_name)
+    except Exception:
+        # e.g. offline and the model isn't downloaded yet - match exactly
+        return None
+
+
+def _split_prompt(prompt: str):
+    """Split a serialized prompt into (exact-match context, final message text).
+
+    Chat models pass the message list serialized as JSON; anything else is
+    treated as a single plain-text prompt.
+    """
+    try:
+        messages = json.loads(prompt)
+        text = messages[-1]["kwargs"]["content"]
+    except (ValueError, TypeError, LookupError):
+        return "", prompt
+    return json.dumps(messages[:-1], sort_keys=True), str(text)
+
+
+class SemanticCache(BaseCache):
+    """LLM cache that matches the final prompt message by embedding similarity.
+
+    Args:
+        threshold: Minimum cosine similarity for a cache hit
+        maxsize: Maximum number of cached responses (least recently used evicted)
+        model_name: sentence-transformers model used for embeddings
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        maxsize: int = 256,
+        model_name: str = EMBEDDING_MODEL,
+    ):
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.model_name = model_name
+        self._encoder = None
+        self._encoder_loaded = False
+        # (context, text) -> (embedding, generations), ordered by recency
+        self._entries = OrderedDict()
+        # text -> embedding for the most recent lookups, so update() does
+        # not re-embed the prompt that just missed
+        self._pending = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _embed(self, text: str):
+        """Return a unit-length embedding for text, or None without an encoder."""
+        if not self._encoder_loaded:
+            self._encoder = _load_encoder(self.model_name)
+            self._encoder_loaded = True
+        if self._encoder is None:
+            return None
+        return self._encoder.encode(text, normalize_embeddings=True)
+
+    def _key(self, prompt: str, llm_string: str):
+        """Return the (context, normalized text) cache key for a prompt."""
+        context, text = _split_prompt(prompt)
+        return (llm_string + context, " ".join(text.lower().split()))
+
+    def _find(self, key, embedding):
+        """Find the best cached entry for this key's context, or None."""
+        if key in self._entries:
+            return key
+
+        if embedding is None:
+            return None
+
+        best_key, best_score = None, self.threshold
+        for entry_key, (entry_embedding, _) in self._entries.items():
+            if entry_key[0] != key[0] or entry_embedding is None:
+                continue
+            # Embeddings are normalized, so the dot product is the cosine
+            score = float(entry_embedding @ embedding)
+            if score >= best_score:
+                best_key, best_score = entry_key, score
+        return best_key
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        key = self._key(prompt, llm_string)
+        embedding = self._embed(key[1])
+
+        entry_key = self._find(key, embedding)
+        if entry_key is None:
+            self.misses += 1
+            self._pending[key] = embedding
+            if len(self._pending) > self.maxsize:
+                self._pending.popitem(last=False)
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(entry_key)
+        return self._entries[entry_key][1]
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        key = self._key(prompt, llm_string)
+        embedding = self._pending.pop(key, None)
+        if embedding is None:
+            embedding = self._embed(key[1])
+
+        self._entries[key] = (embedding, return_val)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self, **kwargs) -> None:
+        self._entries.clear()
+        self._pending.clear()
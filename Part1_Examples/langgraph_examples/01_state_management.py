@@ -21,6 +21,18 @@ from langchain_groq import ChatGroq
 from langchain_core.messages import HumanMessage, AIMessage
 
 
+# Shared LLM client - created once so its HTTP connection pool is reused
+# across node executions and app.invoke calls
+llm = ChatGroq(
+    model="llama-3.3-70b-versatile",
+    temperature=0.7
+)
+
+
+# Number of most recent messages sent to the LLM on each step
+MESSAGE_WINDOW = 10
+
+
 # Define the state schema
 class AgentState(TypedDict):
     """State that flows through the graph.
@@ -44,22 +56,18 @@ def agent_node(state: AgentState) -> dict:
     Returns:
         Dictionary with updated state fields
     """
-    llm = ChatGroq(
-        model="llama-3.3-70b-versatile",
-        temperature=0.7
-    )
-    
     # Get the last user message
     last_message = state["messages"][-1]
     
     # Create a system message with context
     system_context = f"You are a helpful assistant talking to {state['user_name']}."
     
+    # Build the prompt from a sliding window of recent messages
+    prompt = [{"role": "system", "content": system_context}]
+    prompt.extend(state["messages"][-MESSAGE_WINDOW:])
+    
     # Invoke the LLM
-    response = llm.invoke([
-        {"role": "system", "content": system_context},
-        *state["messages"]
-    ])
+    response = llm.invoke(prompt)
     
     # Return updated state
     return {
@@ -8,16 +8,85 @@ Key Concepts:
 - Conditional edges: Dynamic routing based on state
 - Multiple nodes: Different processing steps
 - Control flow: Explicit decision-making
+- Local routing: Embedding classifier answers easy routing decisions
 """
 
 from dotenv import load_dotenv
 load_dotenv()
 
+import asyncio
 from typing import TypedDict, Annotated, Literal
 from langgraph.graph.message import add_messages
 from langgraph.graph import StateGraph, END
 from langchain_groq import ChatGroq
-from langchain_core.messages import HumanMessage, AIMessage
+from langchain_core.messages import HumanMessage
+
+from http_pool import http_client
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # Local routing is optional; the LLM decides instead
+    SentenceTransformer = None
+
+
+# Shared LLM clients - created once so they are reused across node
+# executions and app.invoke calls. Both use the shared http_pool connections.
+# The router only needs to emit "YES" or "NO", so cap its output tightly.
+analysis_llm = ChatGroq(
+    model="llama-3.3-70b-versatile",
+    temperature=0,
+    max_tokens=4,
+    http_client=http_client
+)
+response_llm = ChatGroq(
+    model="llama-3.3-70b-versatile",
+    temperature=0.7,
+    http_client=http_client
+)
+
+
+# Number of most recent messages sent to the LLM on each step
+MESSAGE_WINDOW = 10
+
+
+# Labeled exemplars for the local "needs research?" classifier.
+# Deliberately distinct from the demo queries in main(), so those are routed
+# by genuine similarity (or fall through to the LLM), not by exact lookup.
+RESEARCH_EXEMPLARS = [
+    ("What is 7 times 6?", False),
+    ("What is the capital of France?", False),
+    ("Write a haiku about autumn", False),
+    ("Explain what a function is in Python", False),
+    ("What are the newest breakthroughs in battery technology?", True),
+    ("What is the current price of Bitcoin?", True),
+    ("Summarize this week's news about AI regulation", True),
+    ("Find recent research papers on protein folding", True),
+]
+
+# Minimum cosine similarity to trust the local classifier over the LLM
+LOCAL_ROUTING_THRESHOLD = 0.75
+
+if SentenceTransformer is not None:
+    encoder = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+    exemplar_embeddings = encoder.encode(
+        [text for text, _ in RESEARCH_EXEMPLARS], normalize_embeddings=True
+    )
+else:
+    encoder = None
+
+
+def classify_locally(query: str):
+    """Return True/False if the nearest exemplar is confident, else None."""
+    if encoder is None:
+        return None
+    
+    embedding = encoder.encode(query, normalize_embeddings=True)
+    similarities = exemplar_embeddings @ embedding
+    best = int(similarities.argmax())
+    
+    if similarities[best] > LOCAL_ROUTING_THRESHOLD:
+        return RESEARCH_EXEMPLARS[best][1]
+    return None
 
 
 class WorkflowState(TypedDict):
@@ -30,20 +99,17 @@ class WorkflowState(TypedDict):
 
 def analyze_query(state: WorkflowState) -> dict:
     """Analyze if the query needs research."""
-    llm = ChatGroq(
-        model="llama-3.3-70b-versatile",
-        temperature=0
-    )
-    
     last_message = state["messages"][-1].content
     
-    # Ask LLM if research is needed
-    analysis = llm.invoke([
-        {"role": "system", "content": "Determine if this query needs external research. Reply only 'YES' or 'NO'."},
-        {"role": "user", "content": last_message}
-    ])
+    # Try the local classifier first; only ask the LLM when it's unsure
+    needs_research = classify_locally(last_message)
     
-    needs_research = "yes" in analysis.content.lower()
+    if needs_research is None:
+        analysis = analysis_llm.invoke([
+            {"role": "system", "content": "Determine if this query needs external research. Reply only 'YES' or 'NO'."},
+            {"role": "user", "content": last_message}
+        ])
+        needs_research = "yes" in analysis.content.lower()
     
     return {
         "needs_research": needs_research,
@@ -51,17 +117,30 @@ def analyze_query(state: WorkflowState) -> dict:
     }
 
 
-def research_node(state: WorkflowState) -> dict:
-    """Simulate research step."""
+# Simulated research results
+RESEARCH_CONTEXT = "Found relevant information about the topic."
+
+
+def build_prompt(system_content: str, messages: list) -> list:
+    """Prepend a system message to a sliding window of recent messages."""
+    prompt = [{"role": "system", "content": system_content}]
+    prompt.extend(messages[-MESSAGE_WINDOW:])
+    return prompt
+
+
+def research_and_respond(state: WorkflowState) -> dict:
+    """Simulate research and answer with it in the same LLM call."""
     print("  → Performing research...")
     
-    # Simulated research results
-    research_result = AIMessage(
-        content="[Research completed] Found relevant information about the topic."
-    )
+    # Inject the research into the system prompt instead of adding a
+    # separate research message and node hop
+    response = response_llm.invoke(build_prompt(
+        f"Generate a helpful response. Research context: {RESEARCH_CONTEXT}",
+        state["messages"]
+    ))
     
     return {
-        "messages": [research_result],
+        "messages": [response],
         "research_done": True,
         "iteration": state["iteration"] + 1
     }
@@ -69,17 +148,10 @@ def research_node(state: WorkflowState) -> dict:
 
 def generate_response(state: WorkflowState) -> dict:
     """Generate final response."""
-    llm = ChatGroq(
-        model="llama-3.3-70b-versatile",
-        temperature=0.7
-    )
-    
-    context = "with research" if state.get("research_done", False) else "without research"
-    
-    response = llm.invoke([
-        {"role": "system", "content": f"Generate a helpful response ({context})."},
-        *state["messages"]
-    ])
+    response = response_llm.invoke(build_prompt(
+        "Generate a helpful response (without research).",
+        state["messages"]
+    ))
     
     return {
         "messages": [response],
@@ -89,7 +161,7 @@ def generate_response(state: WorkflowState) -> dict:
 
 def should_research(state: WorkflowState) -> Literal["research", "respond"]:
     """Conditional routing function."""
-    if state.get("needs_research", False) and not state.get("research_done", False):
+    if state.get("needs_research", False):
         return "research"
     return "respond"
 
@@ -100,7 +172,7 @@ def main():
     
     # Add nodes
     workflow.add_node("analyze", analyze_query)
-    workflow.add_node("research", research_node)
+    workflow.add_node("research", research_and_respond)
     workflow.add_node("respond", generate_response)
     
     # Set entry point
@@ -116,10 +188,8 @@ def main():
         }
     )
     
-    # Add edge from research to respond
-    workflow.add_edge("research", "respond")
-    
-    # Add edge from respond to end
+    # Both branches produce the final response
+    workflow.add_edge("research", END)
     workflow.add_edge("respond", END)
     
     # Compile
@@ -130,25 +200,30 @@ def main():
     print("LANGGRAPH WORKFLOW EXAMPLE")
     print("=" * 60)
     
-    # Query 1: Simple question (no research needed)
+    # The queries are independent, so run both graphs concurrently
+    # and let their LLM calls overlap
+    result1, result2 = asyncio.run(app.abatch([
+        # Query 1: Simple question (no research needed)
+        {
+            "messages": [HumanMessage(content="What is 2+2?")],
+            "iteration": 0,
+            "needs_research": False,
+            "research_done": False
+        },
+        # Query 2: Complex question (needs research)
+        {
+            "messages": [HumanMessage(content="What are the latest developments in quantum computing?")],
+            "iteration": 0,
+            "needs_research": False,
+            "research_done": False
+        }
+    ]))
+    
     print("\n--- Query 1: Simple Question ---")
-    result1 = app.invoke({
-        "messages": [HumanMessage(content="What is 2+2?")],
-        "iteration": 0,
-        "needs_research": False,
-        "research_done": False
-    })
     print(f"Response: {result1['messages'][-1].content}")
     print(f"Research performed: {result1.get('research_done', False)}")
     
-    # Query 2: Complex question (needs research)
     print("\n--- Query 2: Complex Question ---")
-    result2 = app.invoke({
-        "messages": [HumanMessage(content="What are the latest developments in quantum computing?")],
-        "iteration": 0,
-        "needs_research": False,
-        "research_done": False
-    })
     print(f"Response: {result2['messages'][-1].content}")
     print(f"Research performed: {result2.get('research_done', False)}")
     
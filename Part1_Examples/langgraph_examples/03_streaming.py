@@ -8,6 +8,7 @@ Key Concepts:
 - Streaming: Real-time state updates
 - State inspection: Visibility into each step
 - Debugging: Understanding the flow
+- Node caching: Replaying the same data reuses deterministic nodes' results
 """
 
 from dotenv import load_dotenv
@@ -16,16 +17,38 @@ load_dotenv()
 from typing import TypedDict, Annotated
 from langgraph.graph.message import add_messages
 from langgraph.graph import StateGraph, END
+from langgraph.types import CachePolicy
+from langgraph.cache.memory import InMemoryCache
 from langchain_groq import ChatGroq
 from langchain_core.messages import HumanMessage
 import json
 
 
+# Shared LLM client - created once so its HTTP connection pool is reused
+# across node executions and app.stream calls
+llm = ChatGroq(
+    model="llama-3.3-70b-versatile",
+    temperature=0.7
+)
+
+
+def merge_dicts(current: dict, update: dict) -> dict:
+    """Reducer for the data channel: a copy of current with update's keys merged in.
+    
+    The copy keeps earlier state snapshots unchanged; it replaces the copy
+    each node used to make with {**state["data"], ...}.
+    """
+    merged = dict(current)
+    merged.update(update)
+    return merged
+
+
 class StreamState(TypedDict):
     """State for streaming example."""
     messages: Annotated[list, add_messages]
     step: str
-    data: dict
+    # Nodes return only the keys they add; merge_dicts combines them
+    data: Annotated[dict, merge_dicts]
 
 
 def step_1_collect(state: StreamState) -> dict:
@@ -47,7 +70,7 @@ def step_2_process(state: StreamState) -> dict:
     
     return {
         "step": "process",
-        "data": {**state["data"], "processed": processed}
+        "data": {"processed": processed}
     }
 
 
@@ -55,11 +78,6 @@ def step_3_generate(state: StreamState) -> dict:
     """Third step: Generate response."""
     print("  [Step 3] Generating response...")
     
-    llm = ChatGroq(
-        model="llama-3.3-70b-versatile",
-        temperature=0.7
-    )
-    
     processed_items = state["data"].get("processed", [])
     
     response = llm.invoke([
@@ -70,17 +88,33 @@ def step_3_generate(state: StreamState) -> dict:
     return {
         "messages": [response],
         "step": "generate",
-        "data": {**state["data"], "final": True}
+        "data": {"final": True}
     }
 
 
+def data_cache_key(state: StreamState) -> str:
+    """Cache key for a node: its input data only.
+    
+    The cached nodes depend only on state["data"]. The default key
+    pickles the whole state, including messages that get a fresh id on
+    every run, so replays would never match.
+    """
+    return json.dumps(state["data"], sort_keys=True)
+
+
+# collect and process are deterministic functions of their input data, so
+# their results can be cached. generate is a temperature-0.7 LLM call and
+# stays live - caching it would freeze one sampled answer.
+DATA_CACHE = CachePolicy(key_func=data_cache_key, ttl=600)
+
+
 def main():
     # Create workflow
     workflow = StateGraph(StreamState)
     
-    # Add nodes
-    workflow.add_node("collect", step_1_collect)
-    workflow.add_node("process", step_2_process)
+    # Add nodes - a replay with the same data reuses collect/process results
+    workflow.add_node("collect", step_1_collect, cache_policy=DATA_CACHE)
+    workflow.add_node("process", step_2_process, cache_policy=DATA_CACHE)
     workflow.add_node("generate", step_3_generate)
     
     # Set up the flow
@@ -89,8 +123,8 @@ def main():
     workflow.add_edge("process", "generate")
     workflow.add_edge("generate", END)
     
-    # Compile
-    app = workflow.compile()
+    # Compile with a cache backend for the cached nodes
+    app = workflow.compile(cache=InMemoryCache())
     
     # Initial state
     initial_state = {
@@ -113,9 +147,9 @@ def main():
             print(f"Node: {node_name}")
             print(f"Current step: {node_state.get('step', 'N/A')}")
             
-            # Show data state
+            # Show data state (compact: one line per event, no indent pass)
             if "data" in node_state:
-                print(f"Data state: {json.dumps(node_state['data'], indent=2)}")
+                print(f"Data state: {json.dumps(node_state['data'], separators=(',', ':'))}")
             
             # Show messages if present
             if "messages" in node_state and node_state["messages"]:
@@ -123,7 +157,15 @@ def main():
                 if hasattr(last_msg, 'content'):
                     print(f"Latest message: {last_msg.content[:100]}...")
     
-
+    # Replay the same input - collect and process are served from the
+    # cache, generate runs again
+    print("\n--- Replay ---")
+    for event in app.stream(initial_state):
+        cached = event.get("__metadata__", {}).get("cached", False)
+        for node_name in event:
+            if node_name != "__metadata__":
+                print(f"Node: {node_name} (cached: {cached})")
+    
     print("=" * 60)
 
 
@@ -17,11 +17,42 @@ Key Concepts:
 from dotenv import load_dotenv
 load_dotenv()
 
+from operator import add
 from typing import TypedDict, Annotated, Literal
 from langgraph.graph.message import add_messages
 from langgraph.graph import StateGraph, END
 from langchain_groq import ChatGroq
 from langchain_core.messages import HumanMessage, AIMessage
+from pydantic import BaseModel, Field
+
+from http_pool import http_client
+
+
+class ContentAnalysis(BaseModel):
+    """Structured result of the analysis node."""
+    topic: str = Field(description="Main topic in one or two words")
+    sentiment: Literal["positive", "negative", "neutral"]
+    complexity: Literal["simple", "moderate", "complex"]
+
+
+# Used when the analyzer's reply can't be parsed into a ContentAnalysis
+DEFAULT_ANALYSIS = {
+    "topic": "technology",
+    "sentiment": "positive",
+    "complexity": "moderate"
+}
+
+
+# Shared LLM clients - created once so they are reused across node
+# executions and app.invoke calls. Both use the shared http_pool connections.
+# The analyzer returns a ContentAnalysis directly, so its answer drives routing.
+# include_raw=True reports parsing failures instead of raising them.
+analysis_llm = ChatGroq(
+    model="llama-3.3-70b-versatile", temperature=0, http_client=http_client
+).with_structured_output(ContentAnalysis, include_raw=True)
+response_llm = ChatGroq(
+    model="llama-3.3-70b-versatile", temperature=0.7, http_client=http_client
+)
 
 
 class ComposedState(TypedDict):
@@ -29,25 +60,37 @@ class ComposedState(TypedDict):
     messages: Annotated[list, add_messages]
     user_input: str
     analysis: dict
-    processing_steps: list
+    # Nodes return only their own step; the add reducer appends it
+    processing_steps: Annotated[list, add]
     final_output: str
     error: str
 
 
+# Inputs shorter than this (after stripping) are rejected
+MIN_INPUT_LENGTH = 5
+
+
+def input_error(user_input: str) -> str:
+    """Return a validation error message, or "" if the input is valid."""
+    if len(user_input.strip()) < MIN_INPUT_LENGTH:
+        return "Input too short"
+    return ""
+
+
 def validate_input(state: ComposedState) -> dict:
     """Node 1: Validate and prepare input."""
     print("  [Node 1] Validating input...")
     
-    user_input = state["user_input"]
+    error = input_error(state["user_input"])
     
-    if len(user_input.strip()) < 5:
+    if error:
         return {
-            "error": "Input too short",
-            "processing_steps": state["processing_steps"] + ["validation_failed"]
+            "error": error,
+            "processing_steps": ["validation_failed"]
         }
     
     return {
-        "processing_steps": state["processing_steps"] + ["validation_passed"]
+        "processing_steps": ["validation_passed"]
     }
 
 
@@ -55,23 +98,19 @@ def analyze_content(state: ComposedState) -> dict:
     """Node 2: Analyze the content."""
     print("  [Node 2] Analyzing content...")
     
-    llm = ChatGroq(model="llama-3.3-70b-versatile", temperature=0)
-    
-    analysis_result = llm.invoke([
+    analysis_result = analysis_llm.invoke([
         {"role": "system", "content": "Analyze this text and identify: topic, sentiment, complexity (simple/moderate/complex)"},
         {"role": "user", "content": state["user_input"]}
     ])
     
-    # Simulate parsing the analysis
-    analysis = {
-        "topic": "technology",
-        "sentiment": "positive",
-        "complexity": "moderate"
-    }
+    # A missing tool call or an out-of-schema value (e.g. sentiment="mixed")
+    # leaves "parsed" empty - fall back to the default analysis
+    parsed = analysis_result["parsed"]
+    analysis = parsed.model_dump() if parsed is not None else DEFAULT_ANALYSIS
     
     return {
         "analysis": analysis,
-        "processing_steps": state["processing_steps"] + ["analysis_complete"]
+        "processing_steps": ["analysis_complete"]
     }
 
 
@@ -79,16 +118,14 @@ def process_simple(state: ComposedState) -> dict:
     """Node 3a: Process simple content."""
     print("  [Node 3a] Processing as simple content...")
     
-    llm = ChatGroq(model="llama-3.3-70b-versatile", temperature=0.7)
-    
-    response = llm.invoke([
+    response = response_llm.invoke([
         {"role": "system", "content": "Provide a brief, simple response."},
         {"role": "user", "content": state["user_input"]}
     ])
     
     return {
         "final_output": response.content,
-        "processing_steps": state["processing_steps"] + ["simple_processing"]
+        "processing_steps": ["simple_processing"]
     }
 
 
@@ -96,16 +133,14 @@ def process_complex(state: ComposedState) -> dict:
     """Node 3b: Process complex content."""
     print("  [Node 3b] Processing as complex content...")
     
-    llm = ChatGroq(model="llama-3.3-70b-versatile", temperature=0.7)
-    
-    response = llm.invoke([
+    response = response_llm.invoke([
         {"role": "system", "content": "Provide a detailed, comprehensive response."},
         {"role": "user", "content": state["user_input"]}
     ])
     
     return {
         "final_output": response.content,
-        "processing_steps": state["processing_steps"] + ["complex_processing"]
+        "processing_steps": ["complex_processing"]
     }
 
 
@@ -115,7 +150,7 @@ def handle_error(state: ComposedState) -> dict:
     
     return {
         "final_output": f"Error: {state['error']}. Please provide valid input.",
-        "processing_steps": state["processing_steps"] + ["error_handled"]
+        "processing_steps": ["error_handled"]
     }
 
 
@@ -135,6 +170,38 @@ def route_after_analysis(state: ComposedState) -> Literal["simple", "complex"]:
     return "simple"
 
 
+def run(app, user_input: str) -> dict:
+    """Run the workflow, rejecting obviously invalid input before the graph starts.
+    
+    Args:
+        app: Compiled composition graph
+        user_input: Text to process
+        
+    Returns:
+        Final workflow state
+    """
+    state = {
+        "messages": [],
+        "user_input": user_input,
+        "analysis": {},
+        "processing_steps": [],
+        "final_output": "",
+        "error": ""
+    }
+    
+    error = input_error(user_input)
+    if error:
+        # Same result as the validate -> error path, without a graph run
+        state["error"] = error
+        state["processing_steps"] = ["validation_failed"]
+        update = handle_error(state)
+        state["final_output"] = update["final_output"]
+        state["processing_steps"] += update["processing_steps"]
+        return state
+    
+    return app.invoke(state)
+
+
 def main():
     # Build the composed graph
     workflow = StateGraph(ComposedState)
@@ -183,28 +250,17 @@ def main():
     
     # Test 1: Valid complex input
     print("\n--- Test 1: Complex Content ---")
-    result1 = app.invoke({
-        "messages": [],
-        "user_input": "Explain the implications of quantum computing on modern cryptography and data security",
-        "analysis": {},
-        "processing_steps": [],
-        "final_output": "",
-        "error": ""
-    })
+    result1 = run(
+        app,
+        "Explain the implications of quantum computing on modern cryptography and data security"
+    )
     
     print(f"\nProcessing Steps: {' → '.join(result1['processing_steps'])}")
     print(f"Final Output: {result1['final_output'][:100]}...")
     
     # Test 2: Invalid input
     print("\n\n--- Test 2: Invalid Input ---")
-    result2 = app.invoke({
-        "messages": [],
-        "user_input": "Hi",
-        "analysis": {},
-        "processing_steps": [],
-        "final_output": "",
-        "error": ""
-    })
+    result2 = run(app, "Hi")
     
     print(f"\nProcessing Steps: {' → '.join(result2['processing_steps'])}")
     print(f"Final Output: {result2['final_output']}")
@@ -0,0 +1,19 @@
+"""
+Shared HTTP Connection Pool
+===========================
+A single keep-alive httpx client for the examples that create more than one
+ChatGroq, so all of their LLM clients reuse the same TCP + TLS connections to
+the Groq API instead of each opening its own.
+
+Usage:
+    from http_pool import http_client
+    llm = ChatGroq(model="llama-3.3-70b-versatile", http_client=http_client)
+"""
+
+import httpx
+
+
+http_client = httpx.Client(
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    timeout=60.0
+)
@@ -1,12 +1,15 @@
-import os
+import asyncio
 from langchain.agents import create_agent
 from langchain.tools import tool
 from dotenv import load_dotenv
 
+from _calculator import answer_locally, evaluate
+from _client import get_model
+
 load_dotenv()
 
 # llama-4-scout supports tool calling correctly on Groq
-MODEL = "groq:meta-llama/llama-4-scout-17b-16e-instruct"
+model = get_model("meta-llama/llama-4-scout-17b-16e-instruct")
 
 
 # --- Single tool ---
@@ -15,50 +18,71 @@ MODEL = "groq:meta-llama/llama-4-scout-17b-16e-instruct"
 @tool
 def calculate(expression: str) -> str:
     """Perform a mathematical calculation."""
-    import sympy
-
-    return str(sympy.sympify(expression))
+    # Return errors as text so the model can correct the expression
+    # instead of the whole agent run aborting
+    try:
+        return evaluate(expression)
+    except (ValueError, ArithmeticError) as e:
+        return f"Error calculating {expression!r}: {e}"
 
 
 agent = create_agent(
-    model=MODEL,
+    model=model,
     tools=[calculate],
 )
 
-result = agent.invoke(
-    {"messages": [{"role": "user", "content": "Calculate 15 * 23 + 42"}]}
-)
-print(result["messages"][-1].content)
-
 
 # --- Multiple tools ---
+# Async tools: when the model requests several in one turn, the agent's
+# tool node awaits them together instead of running them one by one.
 
 
 @tool
-def get_weather(city: str) -> str:
+async def get_weather(city: str) -> str:
     """Get the weather for a city."""
     return f"The weather in {city} is sunny, 22°C."
 
 
 @tool
-def search(query: str) -> str:
+async def search(query: str) -> str:
     """Search for information."""
     return f"Top result for '{query}': LangChain v1 released."
 
 
 agent_multi = create_agent(
-    model=MODEL,
+    model=model,
     tools=[calculate, get_weather, search],
 )
 
-result = agent_multi.invoke(
-    {
-        "messages": [
-            {
-                "role": "user",
-                "content": "What's the weather in Tokyo and search for LangChain v1?",
-            }
-        ]
-    }
-)
-print(result["messages"][-1].content)
+
+# --- Run the agents concurrently ---
+# The queries share no state, so their Groq round-trips can overlap.
+
+
+async def run(runner, query: str) -> str:
+    result = await runner.ainvoke({"messages": [{"role": "user", "content": query}]})
+    return result["messages"][-1].content
+
+
+async def ask(runner, query: str) -> str:
+    # Pure arithmetic needs no model: skip both LLM round-trips
+    # (tool selection + final answer) and evaluate it directly
+    answer = answer_locally(query)
+    if answer is not None:
+        return answer
+    return await run(runner, query)
+
+
+async def main():
+    answer, answer_multi, answer_local = await asyncio.gather(
+        run(agent, "Calculate 15 * 23 + 42"),
+        run(agent_multi, "What's the weather in Tokyo and search for LangChain v1?"),
+        # Answered locally, without calling the agent
+        ask(agent, "What is 2^10 + 1?"),
+    )
+    print(answer)
+    print(answer_multi)
+    print(answer_local)
+
+
+asyncio.run(main())
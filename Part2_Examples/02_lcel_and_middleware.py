@@ -1,12 +1,11 @@
-import os
-from langchain_groq import ChatGroq
 from langchain_core.runnables import RunnableLambda
 from langchain.agents import create_agent
 from dotenv import load_dotenv
 
+from _client import get_model
+
 load_dotenv()
-api_key = os.environ["GROQ_API_KEY"]
-model = ChatGroq(model="llama-3.3-70b-versatile", groq_api_key=api_key)
+model = get_model("llama-3.3-70b-versatile")
 
 
 # --- Example 1: LCEL pipeline (non-agent) ---
@@ -47,8 +46,9 @@ print("\n=== Example 2: Agent with create_agent ===")
 #     ],
 # )
 
+# Pass the model instance so the agent reuses its connection
 agent = create_agent(
-    model="groq:llama-3.3-70b-versatile",
+    model=model,
     tools=[],
 )
 
@@ -1,12 +1,12 @@
-import os
+import asyncio
 from pydantic import BaseModel
-from langchain_groq import ChatGroq
 from langchain.agents import create_agent
 from langchain.agents.structured_output import ProviderStrategy
 from dotenv import load_dotenv
 
+from _client import get_model
+
 load_dotenv()
-api_key = os.environ["GROQ_API_KEY"]
 
 
 class ContactInfo(BaseModel):
@@ -18,38 +18,46 @@ class ContactInfo(BaseModel):
 # --- Example 1: Direct model call with .with_structured_output() ---
 # Uses llama-4-scout which supports json_schema on Groq
 
-print("=== Example 1: Direct Model Call ===")
-
-model = ChatGroq(
-    model="meta-llama/llama-4-scout-17b-16e-instruct", groq_api_key=api_key
-)
+model = get_model("meta-llama/llama-4-scout-17b-16e-instruct")
 structured_model = model.with_structured_output(ContactInfo)
 
-contact = structured_model.invoke(
-    "Extract contact: John Doe, john@example.com, (555) 123-4567"
-)
-print(contact)
-
 
 # --- Example 2: Agent with ProviderStrategy ---
 # Uses llama-4-scout which supports json_schema on Groq
 
-print("\n=== Example 2: Agent with ProviderStrategy ===")
-
 agent = create_agent(
-    model="groq:meta-llama/llama-4-scout-17b-16e-instruct",
+    model=model,
     tools=[],
     response_format=ProviderStrategy(ContactInfo),
 )
 
-result = agent.invoke(
-    {
-        "messages": [
+
+# --- Run both examples concurrently ---
+# The two extractions are independent, so their Groq round-trips can overlap.
+
+
+async def main():
+    contact, result = await asyncio.gather(
+        structured_model.ainvoke(
+            "Extract contact: John Doe, john@example.com, (555) 123-4567"
+        ),
+        agent.ainvoke(
             {
-                "role": "user",
-                "content": "Return contact info for Jane Smith, jane@example.com, (555) 987-6543",
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": "Return contact info for Jane Smith, jane@example.com, (555) 987-6543",
+                    }
+                ]
             }
-        ]
-    }
-)
-print(result["structured_response"])
+        ),
+    )
+
+    print("=== Example 1: Direct Model Call ===")
+    print(contact)
+
+    print("\n=== Example 2: Agent with ProviderStrategy ===")
+    print(result["structured_response"])
+
+
+asyncio.run(main())
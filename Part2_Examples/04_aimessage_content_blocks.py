@@ -1,65 +1,76 @@
-import os
-from langchain_groq import ChatGroq
+import asyncio
+from itertools import chain
 from langchain.tools import tool
 from langchain.agents import create_agent
 from dotenv import load_dotenv
 
+from _calculator import evaluate
+from _client import get_model
+
 load_dotenv()
-api_key = os.environ["GROQ_API_KEY"]
 
 # llama-4-scout supports tool calling correctly on Groq
-model = ChatGroq(
-    model="meta-llama/llama-4-scout-17b-16e-instruct", groq_api_key=api_key
-)
-
-
-# --- Example 1: Basic content access ---
+model = get_model("meta-llama/llama-4-scout-17b-16e-instruct")
 
-print("=== Example 1: Basic Content Access ===")
 
-response = model.invoke("Explain LangChain briefly.")
+@tool
+def calculate(expression: str) -> str:
+    """Perform a mathematical calculation."""
+    # Return errors as text so the model can correct the expression
+    # instead of the whole agent run aborting
+    try:
+        return evaluate(expression)
+    except (ValueError, ArithmeticError) as e:
+        return f"Error calculating {expression!r}: {e}"
 
-# .content for raw string
-print(response.content[:200])
 
-# .text property (v1) — replaces deprecated .text() method
-print(response.text[:200])
+agent = create_agent(
+    model=model,
+    tools=[calculate],
+)
 
 
-# --- Example 2: content_blocks ---
+async def main():
+    # The plain model call and the agent run are independent, so issue
+    # both requests concurrently and inspect the results afterwards.
+    response, result = await asyncio.gather(
+        model.ainvoke("Explain LangChain briefly."),
+        agent.ainvoke({"messages": [{"role": "user", "content": "What is 10 * 5?"}]}),
+    )
 
-print("\n=== Example 2: content_blocks ===")
+    # --- Example 1: Basic content access ---
 
-for block in response.content_blocks:
-    if block["type"] == "reasoning":
-        print(f"Reasoning: {block.get('reasoning')}")
-    elif block["type"] == "text":
-        print(f"Text: {block.get('text', '')[:200]}")
+    print("=== Example 1: Basic Content Access ===")
 
+    # .content for raw string
+    print(response.content[:200])
 
-# --- Example 3: Inspecting tool calls via agent ---
+    # .text property (v1) — replaces deprecated .text() method
+    print(response.text[:200])
 
-print("\n=== Example 3: Tool Calls ===")
+    # --- Example 2: content_blocks ---
 
+    print("\n=== Example 2: content_blocks ===")
 
-@tool
-def calculate(expression: str) -> str:
-    """Perform a mathematical calculation."""
-    import sympy
+    for block in response.content_blocks:
+        if block["type"] == "reasoning":
+            print(f"Reasoning: {block.get('reasoning')}")
+        elif block["type"] == "text":
+            print(f"Text: {block.get('text', '')[:200]}")
 
-    return str(sympy.sympify(expression))
+    # --- Example 3: Inspecting tool calls via agent ---
 
+    print("\n=== Example 3: Tool Calls ===")
 
-agent = create_agent(
-    model="groq:meta-llama/llama-4-scout-17b-16e-instruct",
-    tools=[calculate],
-)
+    # Flatten every message's tool calls and print them in one write
+    calls = chain.from_iterable(
+        getattr(msg, "tool_calls", None) or () for msg in result["messages"]
+    )
+    lines = [f"Tool called: {call['name']} with args {call['args']}" for call in calls]
+    if lines:
+        print("\n".join(lines))
 
-result = agent.invoke({"messages": [{"role": "user", "content": "What is 10 * 5?"}]})
+    print(result["messages"][-1].content)
 
-for msg in result["messages"]:
-    if getattr(msg, "tool_calls", None):
-        for call in msg.tool_calls:
-            print(f"Tool called: {call['name']} with args {call['args']}")
 
-print(result["messages"][-1].content)
+asyncio.run(main())
@@ -1,19 +1,16 @@
-import os
 from typing import TypedDict, Annotated
 from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
-from langchain_groq import ChatGroq
 from langchain.tools import tool
-from langchain_core.messages import ToolMessage
 from dotenv import load_dotenv
 
+from _client import get_model
+from _tools import run_tool_calls
+
 load_dotenv()
-api_key = os.environ["GROQ_API_KEY"]
 
 # llama-4-scout supports tool calling correctly on Groq
-model = ChatGroq(
-    model="meta-llama/llama-4-scout-17b-16e-instruct", groq_api_key=api_key
-)
+model = get_model("meta-llama/llama-4-scout-17b-16e-instruct")
 
 
 # --- State schema ---
@@ -34,7 +31,7 @@ def search(query: str) -> str:
 
 tools = [search]
 model_with_tools = model.bind_tools(tools)
-tools_by_name = {t.name: t for t in tools}
+tools_by_name = {t.name: t.invoke for t in tools}
 
 
 # --- Nodes ---
@@ -46,12 +43,9 @@ def call_model(state: AgentState):
 
 
 def call_tools(state: AgentState):
+    # Independent tool calls run concurrently, in call order
     last_message = state["messages"][-1]
-    results = []
-    for call in last_message.tool_calls:
-        result = tools_by_name[call["name"]].invoke(call["args"])
-        results.append(ToolMessage(content=result, tool_call_id=call["id"]))
-    return {"messages": results}
+    return {"messages": run_tool_calls(tools_by_name, last_message.tool_calls)}
 
 
 def should_continue(state: AgentState):
@@ -72,7 +66,12 @@ graph.add_edge("tools", "agent")
 
 app = graph.compile()
 
-result = app.invoke(
-    {"messages": [{"role": "user", "content": "Search for LangGraph v1 features"}]}
-)
-print(result["messages"][-1].content)
+# stream_mode="messages" yields the model's tokens as they are generated,
+# so the answer starts printing before the final agent step has finished
+for chunk, metadata in app.stream(
+    {"messages": [{"role": "user", "content": "Search for LangGraph v1 features"}]},
+    stream_mode="messages",
+):
+    if metadata["langgraph_node"] == "agent" and chunk.content:
+        print(chunk.content, end="", flush=True)
+print()
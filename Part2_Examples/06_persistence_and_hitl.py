@@ -1,12 +1,15 @@
-import os
 from langgraph.checkpoint.memory import MemorySaver
 from langchain.agents import create_agent
 from langchain.tools import tool
 from dotenv import load_dotenv
 
+from _client import get_model
+from _tools import run_tool_calls
+
 load_dotenv()
 
-MODEL = "groq:meta-llama/llama-4-scout-17b-16e-instruct"
+# One model instance shared by both examples
+model = get_model("meta-llama/llama-4-scout-17b-16e-instruct")
 
 
 @tool
@@ -22,17 +25,22 @@ print("=== Example 1: Persistence with MemorySaver ===")
 memory = MemorySaver()
 
 agent = create_agent(
-    model=MODEL,
+    model=model,
     tools=[search],
     checkpointer=memory,
 )
 
 config = {"configurable": {"thread_id": "session-1"}}
 
+# durability="exit" writes the checkpoint once, when the run finishes or is
+# interrupted, instead of after every agent/tool step. A crash mid-run loses
+# that run's progress, which is fine for an in-process MemorySaver anyway.
+
 # Turn 1
 result = agent.invoke(
     {"messages": [{"role": "user", "content": "Search for LangChain v1"}]},
     config=config,
+    durability="exit",
 )
 print("Turn 1:", result["messages"][-1].content)
 
@@ -40,6 +48,7 @@ print("Turn 1:", result["messages"][-1].content)
 result = agent.invoke(
     {"messages": [{"role": "user", "content": "What did you find?"}]},
     config=config,
+    durability="exit",
 )
 print("Turn 2:", result["messages"][-1].content)
 
@@ -51,16 +60,11 @@ print("\n=== Example 2: Human-in-the-loop (interrupt) ===")
 from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
 from langgraph.checkpoint.memory import MemorySaver
-from langchain_groq import ChatGroq
-from langchain_core.messages import ToolMessage
 from typing import TypedDict, Annotated
 
-api_key = os.environ["GROQ_API_KEY"]
-model = ChatGroq(
-    model="meta-llama/llama-4-scout-17b-16e-instruct", groq_api_key=api_key
-)
+# Bound once at import; call_tools dispatches straight to each tool's invoke
 model_with_tools = model.bind_tools([search])
-tools_by_name = {"search": search}
+tools_by_name = {"search": search.invoke}
 
 
 class AgentState(TypedDict):
@@ -73,12 +77,9 @@ def call_model(state: AgentState):
 
 
 def call_tools(state: AgentState):
+    # Independent tool calls run concurrently, in call order
     last_message = state["messages"][-1]
-    results = []
-    for call in last_message.tool_calls:
-        result = tools_by_name[call["name"]].invoke(call["args"])
-        results.append(ToolMessage(content=result, tool_call_id=call["id"]))
-    return {"messages": results}
+    return {"messages": run_tool_calls(tools_by_name, last_message.tool_calls)}
 
 
 def should_continue(state: AgentState):
@@ -102,10 +103,11 @@ app = graph.compile(checkpointer=checkpointer, interrupt_before=["tools"])
 
 config_hitl = {"configurable": {"thread_id": "hitl-1"}}
 
-# Step 1: run until interrupted
+# Step 1: run until interrupted — the interrupt still saves a checkpoint
 result = app.invoke(
     {"messages": [{"role": "user", "content": "Search for LangGraph persistence"}]},
     config=config_hitl,
+    durability="exit",
 )
 print("Interrupted — pending tool calls:")
 for msg in result["messages"]:
@@ -115,5 +117,5 @@ for msg in result["messages"]:
 
 # Step 2: human approves — resume by passing None
 print("Resuming after human approval...")
-result = app.invoke(None, config=config_hitl)
+result = app.invoke(None, config=config_hitl, durability="exit")
 print("Final:", result["messages"][-1].content)
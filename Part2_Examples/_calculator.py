@@ -0,0 +1,104 @@
+import ast
+import math
+import operator
+import re
+from functools import lru_cache
+
+# Arithmetic-only evaluator shared by the calculate tools.
+# Only numeric literals and the operators below are accepted, so unlike
+# eval() there is no way to reach names, attributes or calls.
+
+_BINARY_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+
+_UNARY_OPS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+# Largest integer result allowed, in bits. Checked before each power and
+# after every operation, so expressions like 9**9**9 or (9**999)**999 fail
+# fast instead of hanging the process.
+MAX_RESULT_BITS = 4096
+
+
+def _check_size(value):
+    if isinstance(value, int) and value.bit_length() > MAX_RESULT_BITS:
+        raise ValueError("Result too large")
+    return value
+
+
+def _eval_node(node):
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+        left = _eval_node(node.left)
+        right = _eval_node(node.right)
+        op = _BINARY_OPS[type(node.op)]
+        if op is operator.pow and abs(left) > 1 and right * math.log2(abs(left)) > MAX_RESULT_BITS:
+            raise ValueError("Result too large")
+        return _check_size(op(left, right))
+
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+        return _check_size(_UNARY_OPS[type(node.op)](_eval_node(node.operand)))
+
+    raise ValueError(f"Unsupported expression element: {type(node).__name__}")
+
+
+@lru_cache(maxsize=256)
+def evaluate(expression: str) -> str:
+    """Evaluate an arithmetic expression such as "15 * 23 + 42".
+
+    Models often write powers as "2^8", so ^ is read as ** (the same rewrite
+    as sympy's convert_xor), keeping the precedence and right-associativity
+    of a power.
+
+    >>> evaluate("15 * 23 + 42")
+    '387'
+    >>> evaluate("2^3+1"), evaluate("2*3^2"), evaluate("2^3^2")
+    ('9', '18', '512')
+    >>> evaluate("(9**999)**999")
+    Traceback (most recent call last):
+    ...
+    ValueError: Result too large
+    """
+    try:
+        tree = ast.parse(expression.strip().replace("^", "**"), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid expression: {expression!r}") from e
+    return str(_eval_node(tree.body))
+
+
+# "Calculate 15 * 23 + 42", "what is 2**8?" - a request that is nothing but
+# arithmetic, so it can be answered without a model round-trip
+_ARITHMETIC_QUERY_RE = re.compile(
+    r"\s*(?:calculate|compute|what\s+is)\s+([-+*/%^().\d\s]+?)\s*[?.!]?\s*",
+    re.IGNORECASE,
+)
+# A binary operator after an operand; "What is 911?" is a question, not a sum
+_OPERATOR_RE = re.compile(r"[\d.)]\s*[-+*/%^]")
+
+
+def answer_locally(query: str):
+    """Return the result of a pure-arithmetic query, or None if it isn't one.
+
+    >>> answer_locally("Calculate 15 * 23 + 42"), answer_locally("what is 2^3+1?")
+    ('387', '9')
+    >>> answer_locally("What is 911?") is None, answer_locally("what is 404") is None
+    (True, True)
+    """
+    match = _ARITHMETIC_QUERY_RE.fullmatch(query)
+    if match is None or not _OPERATOR_RE.search(match.group(1)):
+        return None
+    try:
+        return evaluate(match.group(1))
+    except (ValueError, ArithmeticError):
+        return None
@@ -0,0 +1,29 @@
+import importlib.util
+from functools import lru_cache
+
+import httpx
+from langchain_groq import ChatGroq
+
+# HTTP/2 multiplexes concurrent requests over one connection; it needs the
+# optional "h2" package (pip install "httpx[http2]"), else HTTP/1.1 is used
+_HTTP2 = importlib.util.find_spec("h2") is not None
+_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+# Connection pools shared by every model, sync and async
+http_client = httpx.Client(http2=_HTTP2, limits=_LIMITS, timeout=60.0)
+http_async_client = httpx.AsyncClient(http2=_HTTP2, limits=_LIMITS, timeout=60.0)
+
+
+@lru_cache(maxsize=None)
+def get_model(name: str, **kwargs) -> ChatGroq:
+    """Return the process-wide ChatGroq for this model name and settings.
+
+    Reads GROQ_API_KEY from the environment. Every model shares the same
+    HTTP connection pools, so TCP + TLS setup is paid once per process.
+    """
+    return ChatGroq(
+        model=name,
+        http_client=http_client,
+        http_async_client=http_async_client,
+        **kwargs,
+    )
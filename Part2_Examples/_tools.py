@@ -0,0 +1,29 @@
+from functools import partial
+
+from langchain_core.messages import ToolMessage
+from langchain_core.runnables.config import ContextThreadPoolExecutor
+
+# Tool-call execution shared by the hand-built StateGraph examples.
+# tools_by_name maps a tool name to a callable taking the call's args,
+# e.g. {"search": search.invoke}.
+
+
+def run_tool(tools_by_name: dict, call: dict):
+    return tools_by_name[call["name"]](call["args"])
+
+
+def run_tool_calls(tools_by_name: dict, tool_calls: list) -> list:
+    """Run independent tool calls concurrently and return their ToolMessages.
+
+    ContextThreadPoolExecutor copies the caller's contextvars into each
+    worker, so tools keep the parent run's config and tracing. map() keeps
+    the results in call order.
+    """
+    if not tool_calls:
+        return []
+    with ContextThreadPoolExecutor(max_workers=len(tool_calls)) as executor:
+        outputs = list(executor.map(partial(run_tool, tools_by_name), tool_calls))
+    return [
+        ToolMessage(content=output, tool_call_id=call["id"])
+        for call, output in zip(tool_calls, outputs)
+    ]